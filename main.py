@@ -7,10 +7,14 @@ Company: Smart Lifemonitor, Inc.
 Description: Edge API for IoT vital parameters monitoring with DDD + CQRS
 """
 
-from fastapi import FastAPI, HTTPException, status
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import ValidationError
 from contextlib import asynccontextmanager
-from datetime import datetime
+from typing import Dict, Literal, Optional, Tuple
+import os
+import cbor2
+import orjson
 import uvicorn
 
 from vital_monitoring.application.commands.record_vitals_reading_command import (
@@ -25,7 +29,16 @@ from vital_monitoring.application.queries.get_vital_history_query import (
     GetVitalHistoryQuery,
     GetVitalHistoryQueryHandler
 )
+from vital_monitoring.application.services.ingest_queue import VitalIngestQueue
+from vital_monitoring.domain.entities.vitals_reading import InvalidVitalReadingError
+from vital_monitoring.domain.services.clock import iso_now
 from vital_monitoring.infrastructure.dtos.vitals_reading_dto import VitalReadingDto
+from vital_monitoring.infrastructure.middleware.internal_error_middleware import (
+    InternalErrorMiddleware
+)
+from vital_monitoring.infrastructure.middleware.scoped_cors_middleware import (
+    ScopedCORSMiddleware
+)
 from vital_monitoring.infrastructure.persistence.in_memory_vitals_repository import (
     InMemoryVitalRepository
 )
@@ -33,26 +46,61 @@ from vital_monitoring.infrastructure.persistence.in_memory_vitals_repository imp
 # Shared repository instance (in production, use dependency injection)
 vital_repository = InMemoryVitalRepository()
 
+# Writes are drained into the repository by a background task (see lifespan)
+ingest_queue = VitalIngestQueue(vital_repository)
+
+
+# Handlers are stateless apart from the repository, so each one is built
+# once and shared by every request through FastAPI dependencies. The
+# dependencies are coroutines: FastAPI runs plain `def` dependencies in a
+# threadpool, which would cost far more than building the handler.
+record_handler = RecordVitalReadingCommandHandler(vital_repository, ingest_queue)
+device_status_handler = GetDeviceStatusQueryHandler(vital_repository)
+vital_history_handler = GetVitalHistoryQueryHandler(vital_repository)
+
+
+async def get_record_handler() -> RecordVitalReadingCommandHandler:
+    """Dependency: shared RecordVitalReadingCommandHandler"""
+    return record_handler
+
+
+async def get_device_status_handler() -> GetDeviceStatusQueryHandler:
+    """Dependency: shared GetDeviceStatusQueryHandler"""
+    return device_status_handler
+
+
+async def get_vital_history_handler() -> GetVitalHistoryQueryHandler:
+    """Dependency: shared GetVitalHistoryQueryHandler"""
+    return vital_history_handler
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     print("Starting Smart LifeWatching Edge API...")
     print("Vital Monitoring Bounded Context initialized")
+    ingest_queue.start()
     yield
     print("Shutting down Edge API...")
+    await ingest_queue.stop()
 
 
 app = FastAPI(
     title="Smart LifeWatching Edge API",
     description="Edge API for IoT Vital Parameters Monitoring with DDD + CQRS",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# CORS Configuration for IoT devices
+# Unhandled errors become 500 responses inside the CORS layer (middleware
+# added first runs innermost), so browsers can read them
+app.add_middleware(InternalErrorMiddleware)
+
+# CORS Configuration for browser clients (IoT device routes skip CORS)
 app.add_middleware(
-    CORSMiddleware,
+    ScopedCORSMiddleware,
+    exclude_prefixes=("/api/v1/iot/",),
     allow_origins=["*"],  # In production, specify device origins
     allow_credentials=True,
     allow_methods=["*"],
@@ -60,35 +108,75 @@ app.add_middleware(
 )
 
 
+# ============================================================================
+# EXCEPTION HANDLERS
+# ============================================================================
+
+# Only domain rule violations and payload validation errors are client
+# errors; anything else is answered with 500 by InternalErrorMiddleware
+
+@app.exception_handler(InvalidVitalReadingError)
+@app.exception_handler(ValidationError)
+async def invalid_input_handler(request: Request, exc: ValueError):
+    """Domain rule violations and invalid input map to 400 Bad Request"""
+    return ORJSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)}
+    )
+
+
 # ============================================================================
 # HEALTH CHECK ENDPOINTS
 # ============================================================================
 
+_ROOT_PAYLOAD = {
+    "service": "Smart LifeWatching Edge API",
+    "status": "operational",
+    "bounded_context": "Vital Monitoring",
+    "architecture": "DDD + CQRS"
+}
+
+_HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "components": {
+        "api": "operational",
+        "repository": "operational",
+        "command_handlers": "operational",
+        "query_handlers": "operational"
+    }
+}
+
+# Encoded health bodies by name, as (timestamp, body bytes)
+_health_bodies: Dict[str, Tuple[str, bytes]] = {}
+
+
+def _health_response(name: str, payload: dict) -> Response:
+    """
+    Serve a static payload stamped with the current second
+
+    The body only changes when the timestamp does, so it is encoded at
+    most once per second and served as pre-encoded bytes otherwise.
+    """
+    timestamp = iso_now()
+    cached = _health_bodies.get(name)
+    if cached is None or cached[0] != timestamp:
+        cached = _health_bodies[name] = (
+            timestamp,
+            orjson.dumps({**payload, "timestamp": timestamp})
+        )
+    return Response(content=cached[1], media_type="application/json")
+
+
 @app.get("/", tags=["Health"])
 async def root():
     """Root endpoint - API health check"""
-    return {
-        "service": "Smart LifeWatching Edge API",
-        "status": "operational",
-        "bounded_context": "Vital Monitoring",
-        "architecture": "DDD + CQRS",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    return _health_response("root", _ROOT_PAYLOAD)
 
 
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Detailed health check"""
-    return {
-        "status": "healthy",
-        "components": {
-            "api": "operational",
-            "repository": "operational",
-            "command_handlers": "operational",
-            "query_handlers": "operational"
-        },
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    return _health_response("health", _HEALTH_PAYLOAD)
 
 
 # ============================================================================
@@ -101,48 +189,51 @@ async def health_check():
     tags=["Commands"],
     summary="Record a new vital reading from IoT device"
 )
-async def record_vital_reading(dto: VitalReadingDto):
+async def record_vital_reading(
+        dto: VitalReadingDto,
+        echo: Optional[Literal["full"]] = None,
+        handler: RecordVitalReadingCommandHandler = Depends(get_record_handler)
+):
     """
     Command: Record vital reading from IoT device
 
     This endpoint receives vital parameters (weight and heart rate) from
     the Smart LifeWatching device and processes them through CQRS command handler.
 
+    By default only a minimal acknowledgement is returned; pass
+    `?echo=full` to get the classified reading back.
+
     Args:
         dto: VitalReadingDto containing device_id, weight, heart_rate
+        echo: "full" to echo the whole recorded reading
+        handler: Shared command handler (injected)
 
     Returns:
-        Command execution result with reading_id
+        Acknowledgement with reading_id, or the full command result
     """
-    try:
-        # Create command
-        command = RecordVitalReadingCommand(
-            device_id=dto.device_id,
-            weight_kg=dto.weight_kg,
-            heart_rate_bpm=dto.heart_rate_bpm
-        )
+    # Create command
+    command = RecordVitalReadingCommand(
+        device_id=dto.device_id,
+        weight_kg=dto.weight_kg,
+        heart_rate_bpm=dto.heart_rate_bpm
+    )
 
-        # Execute command through handler
-        handler = RecordVitalReadingCommandHandler(vital_repository)
-        result = await handler.handle(command)
+    # Execute command through handler
+    result = await handler.handle(command, full=echo == "full")
 
+    if echo != "full":
         return {
-            "success": True,
-            "message": "Vital reading recorded successfully",
-            "data": result,
-            "timestamp": datetime.utcnow().isoformat()
+            "accepted": True,
+            "reading_id": result["reading_id"],
+            "is_critical": result["is_critical"]
         }
 
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Internal server error: {str(e)}"
-        )
+    return {
+        "success": True,
+        "message": "Vital reading recorded successfully",
+        "data": result,
+        "timestamp": iso_now()
+    }
 
 
 # ============================================================================
@@ -154,7 +245,10 @@ async def record_vital_reading(dto: VitalReadingDto):
     tags=["Queries"],
     summary="Get current device status"
 )
-async def get_device_status(device_id: str):
+async def get_device_status(
+        device_id: str,
+        handler: GetDeviceStatusQueryHandler = Depends(get_device_status_handler)
+):
     """
     Query: Get current device status and latest reading
 
@@ -162,45 +256,40 @@ async def get_device_status(device_id: str):
 
     Args:
         device_id: Unique identifier of the IoT device
+        handler: Shared query handler (injected)
 
     Returns:
         Device status with latest vital parameters
     """
-    try:
-        # Create query
-        query = GetDeviceStatusQuery(device_id=device_id)
+    # Create query
+    query = GetDeviceStatusQuery(device_id=device_id)
 
-        # Execute query through handler
-        handler = GetDeviceStatusQueryHandler(vital_repository)
-        result = await handler.handle(query)
+    # Execute query through handler
+    result = await handler.handle(query)
 
-        if not result:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Device {device_id} not found or has no readings"
-            )
-
-        return {
-            "success": True,
-            "data": result,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not result:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Internal server error: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Device {device_id} not found or has no readings"
         )
 
+    return {
+        "success": True,
+        "data": result,
+        "timestamp": iso_now()
+    }
+
 
 @app.get(
     "/api/v1/vital-monitoring/devices/{device_id}/history",
     tags=["Queries"],
     summary="Get vital readings history"
 )
-async def get_vital_history(device_id: str, limit: int = 50):
+async def get_vital_history(
+        device_id: str,
+        limit: int = 50,
+        handler: GetVitalHistoryQueryHandler = Depends(get_vital_history_handler)
+):
     """
     Query: Get historical vital readings for a device
 
@@ -209,33 +298,26 @@ async def get_vital_history(device_id: str, limit: int = 50):
     Args:
         device_id: Unique identifier of the IoT device
         limit: Maximum number of readings to return (default: 50)
+        handler: Shared query handler (injected)
 
     Returns:
         List of vital readings with timestamps
     """
-    try:
-        # Create query
-        query = GetVitalHistoryQuery(device_id=device_id, limit=limit)
+    # Create query
+    query = GetVitalHistoryQuery(device_id=device_id, limit=limit)
 
-        # Execute query through handler
-        handler = GetVitalHistoryQueryHandler(vital_repository)
-        result = await handler.handle(query)
-
-        return {
-            "success": True,
-            "data": {
-                "device_id": device_id,
-                "readings_count": len(result),
-                "readings": result
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
+    # Execute query through handler
+    result = await handler.handle(query)
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Internal server error: {str(e)}"
-        )
+    return {
+        "success": True,
+        "data": {
+            "device_id": device_id,
+            "readings_count": len(result),
+            "readings": result
+        },
+        "timestamp": iso_now()
+    }
 
 
 # ============================================================================
@@ -249,61 +331,110 @@ async def get_vital_history(device_id: str, limit: int = 50):
     summary="Simplified endpoint for IoT device data submission"
 )
 async def receive_iot_data(
-        device_id: str,
-        weight: float,
-        heart_rate: int,
-        status: str
+        dto: VitalReadingDto,
+        handler: RecordVitalReadingCommandHandler = Depends(get_record_handler)
 ):
     """
     Simplified endpoint for Arduino/ESP devices
 
-    Accepts form parameters for easier integration with IoT devices
-    that may have limited HTTP client capabilities.
+    Accepts the same JSON body as the command endpoint but answers with
+    a compact acknowledgement, for IoT devices that may have limited
+    HTTP client capabilities. The server classifies the reading itself.
 
     Args:
-        device_id: Device identifier
-        weight: Weight in kilograms
-        heart_rate: Heart rate in BPM
-        status: Heart rate status (Low/Normal/High)
+        dto: VitalReadingDto containing device_id, weight, heart_rate
+        handler: Shared command handler (injected)
 
     Returns:
         Acceptance confirmation
     """
-    try:
-        # Convert to DTO
-        dto = VitalReadingDto(
-            device_id=device_id,
-            weight_kg=weight,
-            heart_rate_bpm=heart_rate
-        )
+    # Process through command handler
+    command = RecordVitalReadingCommand(
+        device_id=dto.device_id,
+        weight_kg=dto.weight_kg,
+        heart_rate_bpm=dto.heart_rate_bpm
+    )
 
-        # Process through command handler
-        command = RecordVitalReadingCommand(
-            device_id=dto.device_id,
-            weight_kg=dto.weight_kg,
-            heart_rate_bpm=dto.heart_rate_bpm
-        )
+    # Fire-and-forget: the reading is persisted by the ingest queue
+    result = await handler.handle(command, wait=False)
 
-        handler = RecordVitalReadingCommandHandler(vital_repository)
-        result = await handler.handle(command)
+    return {
+        "accepted": True,
+        "reading_id": result["reading_id"],
+        "message": "Data received and queued for processing"
+    }
 
-        return {
-            "accepted": True,
-            "reading_id": result["reading_id"],
-            "message": "Data received and processed"
-        }
 
-    except Exception as e:
+@app.post(
+    "/api/v1/iot/vital-data-cbor",
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["IoT Integration"],
+    summary="Compact CBOR endpoint for constrained IoT devices",
+    response_class=Response
+)
+async def receive_iot_data_cbor(
+        request: Request,
+        handler: RecordVitalReadingCommandHandler = Depends(get_record_handler)
+):
+    """
+    CBOR endpoint for Arduino/ESP devices
+
+    Accepts a CBOR-encoded map with the same fields as VitalReadingDto
+    (Content-Type: application/cbor) and answers with a CBOR
+    acknowledgement. CBOR payloads are smaller than JSON and cheaper to
+    encode on constrained devices.
+
+    Args:
+        request: Raw request carrying the CBOR body
+        handler: Shared command handler (injected)
+
+    Returns:
+        CBOR-encoded acceptance confirmation
+    """
+    try:
+        payload = cbor2.loads(await request.body())
+    except cbor2.CBORDecodeError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+            detail=f"Invalid CBOR payload: {e}"
+        ) from e
+
+    # Validate through the same DTO contract as the JSON endpoints
+    dto = VitalReadingDto.model_validate(payload)
+
+    command = RecordVitalReadingCommand(
+        device_id=dto.device_id,
+        weight_kg=dto.weight_kg,
+        heart_rate_bpm=dto.heart_rate_bpm
+    )
+
+    # Fire-and-forget: the reading is persisted by the ingest queue
+    result = await handler.handle(command, wait=False)
+
+    return Response(
+        content=cbor2.dumps({"accepted": True, "reading_id": result["reading_id"]}),
+        status_code=status.HTTP_202_ACCEPTED,
+        media_type="application/cbor"
+    )
 
 
 if __name__ == "__main__":
+    # Auto-reload is a development convenience only (EDGE_API_RELOAD=1); it
+    # forces a single worker process and is never enabled by default.
+    reload = os.getenv("EDGE_API_RELOAD", "0") == "1"
+
+    # Each worker owns its own in-memory repository, so the worker count is
+    # opt-in through WEB_CONCURRENCY (e.g. WEB_CONCURRENCY=$(nproc)).
+    workers = 1 if reload else int(os.getenv("WEB_CONCURRENCY", "1"))
+
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
-        port=8000,
-        reload=True
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+        reload=reload,
+        limit_concurrency=1000,
+        timeout_keep_alive=30
     )
\ No newline at end of file
@@ -0,0 +1,307 @@
+"""
+Tests - In-Memory Repository Storage
+
+Ring eviction, compaction, batch appends and row slicing of the per-device
+Struct-of-Arrays buffer behind InMemoryVitalRepository.
+"""
+
+import pytest
+
+from vital_monitoring.domain.entities.vitals_reading import VitalReading
+from vital_monitoring.infrastructure.persistence.in_memory_vitals_repository import (
+    InMemoryVitalRepository,
+    _DeviceBuffer
+)
+
+
+def make_reading(time_ns: int, weight_kg: float = 70.0, heart_rate_bpm: int = 70,
+                 device_id: str = "device-1") -> VitalReading:
+    """Build a reading with an explicit timestamp"""
+    return VitalReading(
+        device_id=device_id,
+        weight_kg=weight_kg,
+        heart_rate_bpm=heart_rate_bpm,
+        time_ns=time_ns
+    )
+
+
+def live_rows(buffer: _DeviceBuffer) -> list:
+    """(reading_id, time_ns) of the live rows, oldest first"""
+    rows = range(buffer.start, buffer.start + buffer.size)
+    return [(buffer.reading_ids[row], int(buffer.timestamps[row])) for row in rows]
+
+
+def test_insert_evicts_oldest_at_max_size():
+    buffer = _DeviceBuffer(capacity=8, max_size=3)
+    readings = [make_reading(time_ns) for time_ns in (10, 20, 30, 40)]
+
+    evicted = [buffer.insert(reading) for reading in readings]
+
+    assert evicted == [None, None, None, readings[0].reading_id]
+    assert buffer.size == 3
+    assert live_rows(buffer) == [(r.reading_id, r.time_ns) for r in readings[1:]]
+
+
+def test_out_of_order_reading_older_than_window_evicts_itself():
+    buffer = _DeviceBuffer(capacity=8, max_size=3)
+    for time_ns in (10, 20, 30):
+        buffer.insert(make_reading(time_ns))
+    before = live_rows(buffer)
+
+    late = make_reading(5)
+
+    assert buffer.insert(late) == late.reading_id
+    assert live_rows(buffer) == before
+
+
+def test_out_of_order_reading_is_inserted_in_timestamp_order():
+    buffer = _DeviceBuffer(capacity=8, max_size=3)
+    first, third = make_reading(10), make_reading(30)
+    buffer.insert(first)
+    buffer.insert(third)
+    second = make_reading(20, weight_kg=85.0)
+
+    assert buffer.insert(second) is None
+    assert [reading_id for reading_id, _ in live_rows(buffer)] == [
+        first.reading_id, second.reading_id, third.reading_id
+    ]
+    assert buffer.to_entity("device-1", buffer.start + 1) == second
+    assert buffer.critical_count == 1
+
+
+def test_critical_count_tracks_evictions():
+    buffer = _DeviceBuffer(capacity=8, max_size=2)
+    buffer.insert(make_reading(10, heart_rate_bpm=130))
+    buffer.insert(make_reading(20))
+    assert buffer.critical_count == 1
+
+    buffer.insert(make_reading(30))
+
+    assert buffer.critical_count == 0
+    assert buffer.critical_rows().size == 0
+
+
+def test_full_columns_compact_in_place_when_mostly_evicted():
+    buffer = _DeviceBuffer(capacity=8, max_size=3)
+    for time_ns in range(8):
+        buffer.insert(make_reading(time_ns))
+    assert (buffer.start, buffer.size) == (5, 3)
+    weights = buffer.weights
+
+    buffer.insert(make_reading(8))
+
+    # Compacted to the front, then the new row evicted the oldest again
+    assert buffer.weights is weights
+    assert (buffer.start, buffer.size) == (1, 3)
+    assert [time_ns for _, time_ns in live_rows(buffer)] == [6, 7, 8]
+    assert len(buffer.reading_ids) == buffer.start + buffer.size
+
+
+def test_full_columns_grow_when_mostly_live():
+    buffer = _DeviceBuffer(capacity=4, max_size=100)
+    readings = [make_reading(time_ns) for time_ns in range(5)]
+
+    for reading in readings:
+        buffer.insert(reading)
+
+    assert buffer.weights.shape[0] > 4
+    assert buffer.start == 0
+    assert live_rows(buffer) == [(r.reading_id, r.time_ns) for r in readings]
+
+
+def test_recent_slice_matches_recent_rows():
+    buffer = _DeviceBuffer(capacity=8, max_size=3)
+    for time_ns in (10, 20, 30):
+        buffer.insert(make_reading(time_ns))
+    assert buffer.start == 0
+
+    for limit in (0, 1, 2, 3, 10, -1):
+        rows = buffer.recent_slice(limit)
+        assert buffer.timestamps[rows].tolist() == \
+            buffer.timestamps[buffer.recent_rows(limit)].tolist()
+
+    # start == 0 with every row requested must not wrap to an empty slice
+    assert buffer.reading_ids[buffer.recent_slice(3)] == \
+        buffer.reading_ids[2::-1]
+    assert buffer.reading_ids[buffer.recent_slice(0)] == []
+
+
+def test_recent_slice_after_eviction():
+    buffer = _DeviceBuffer(capacity=8, max_size=3)
+    for time_ns in (10, 20, 30, 40, 50):
+        buffer.insert(make_reading(time_ns))
+    assert buffer.start == 2
+
+    assert buffer.timestamps[buffer.recent_slice(10)].tolist() == [50, 40, 30]
+    assert buffer.timestamps[buffer.recent_slice(2)].tolist() == [50, 40]
+    assert buffer.timestamps[buffer.recent_slice(0)].tolist() == []
+
+
+def test_recent_slice_of_empty_buffer():
+    buffer = _DeviceBuffer(capacity=0)
+
+    assert buffer.reading_ids[buffer.recent_slice(50)] == []
+    assert buffer.timestamps[buffer.recent_slice(50)].size == 0
+
+
+def test_evicted_ids_are_dropped_from_the_reading_index():
+    repository = InMemoryVitalRepository(max_readings_per_device=5)
+    # Mostly in order, with a late reading every seventh save
+    saved = [
+        repository._save_sync(make_reading(time_ns - 20 if time_ns % 7 == 0 else time_ns))
+        for time_ns in range(100, 150)
+    ]
+    buffer = repository._buffer_of("device-1")
+
+    assert len(repository._reading_devices) == buffer.size == 5
+    assert set(repository._reading_devices) == {
+        reading_id for reading_id, _ in live_rows(buffer)
+    }
+    for reading in saved:
+        found = repository._find_by_id_sync(reading.reading_id)
+        assert (found is not None) == (reading.reading_id in repository._reading_devices)
+    assert repository._count_by_device_sync("device-1") == 50
+
+
+def spy_on_row_inserts(monkeypatch) -> list:
+    """Record calls to the row-by-row insert path of every buffer"""
+    calls = []
+    insert_row = _DeviceBuffer._insert_row
+
+    def recording_insert_row(self, vital_reading, *values):
+        calls.append(vital_reading.reading_id)
+        return insert_row(self, vital_reading, *values)
+
+    monkeypatch.setattr(_DeviceBuffer, "_insert_row", recording_insert_row)
+    return calls
+
+
+def test_extend_appends_ordered_batch_with_slice_writes(monkeypatch):
+    buffer = _DeviceBuffer(capacity=4, max_size=100)
+    buffer.insert(make_reading(10))
+    batch = [make_reading(time_ns) for time_ns in (10, 20, 20, 30, 40)]
+    row_inserts = spy_on_row_inserts(monkeypatch)
+
+    assert buffer.extend(batch) == []
+
+    assert row_inserts == []
+    assert live_rows(buffer)[1:] == [(r.reading_id, r.time_ns) for r in batch]
+    assert buffer.weights.shape[0] >= buffer.size == 6
+
+
+def test_extend_falls_back_to_row_inserts_for_unordered_batch(monkeypatch):
+    buffer = _DeviceBuffer(capacity=8, max_size=100)
+    batch = [make_reading(time_ns) for time_ns in (30, 10, 20)]
+    row_inserts = spy_on_row_inserts(monkeypatch)
+
+    assert buffer.extend(batch) == []
+
+    assert row_inserts == [reading.reading_id for reading in batch]
+    assert [time_ns for _, time_ns in live_rows(buffer)] == [10, 20, 30]
+
+
+def test_extend_batch_starting_before_newest_row(monkeypatch):
+    buffer = _DeviceBuffer(capacity=8, max_size=100)
+    for time_ns in (10, 20, 30):
+        buffer.insert(make_reading(time_ns))
+    batch = [make_reading(time_ns) for time_ns in (25, 35)]
+    row_inserts = spy_on_row_inserts(monkeypatch)
+
+    assert buffer.extend(batch) == []
+
+    assert len(row_inserts) == 2
+    assert [time_ns for _, time_ns in live_rows(buffer)] == [10, 20, 25, 30, 35]
+
+
+def test_extend_batch_straddling_max_size_evicts_oldest():
+    buffer = _DeviceBuffer(capacity=8, max_size=4)
+    existing = [make_reading(time_ns) for time_ns in (10, 20, 30)]
+    for reading in existing:
+        buffer.insert(reading)
+    batch = [make_reading(time_ns) for time_ns in (40, 50, 60)]
+
+    evicted = buffer.extend(batch)
+
+    assert evicted == [reading.reading_id for reading in existing[:2]]
+    assert live_rows(buffer) == [
+        (r.reading_id, r.time_ns) for r in existing[2:] + batch
+    ]
+
+
+def test_extend_batch_larger_than_max_size_evicts_its_own_oldest():
+    buffer = _DeviceBuffer(capacity=8, max_size=2)
+    batch = [make_reading(time_ns) for time_ns in (10, 20, 30, 40)]
+
+    evicted = buffer.extend(batch)
+
+    assert evicted == [reading.reading_id for reading in batch[:2]]
+    assert live_rows(buffer) == [(r.reading_id, r.time_ns) for r in batch[2:]]
+
+
+def test_extend_rejects_unstorable_batch_without_writing():
+    buffer = _DeviceBuffer(capacity=8, max_size=100)
+    buffer.insert(make_reading(10))
+    before = live_rows(buffer)
+    batch = [
+        make_reading(20),
+        VitalReading(
+            device_id="device-1",
+            weight_kg=float("nan"),
+            heart_rate_bpm=70,
+            time_ns=30,
+            validate=False
+        )
+    ]
+
+    with pytest.raises(ValueError):
+        buffer.extend(batch)
+
+    assert live_rows(buffer) == before
+    assert buffer.critical_count == 0
+
+
+def test_save_many_keeps_counters_consistent_when_a_device_fails():
+    repository = InMemoryVitalRepository()
+    bad = VitalReading(
+        device_id="device-2",
+        weight_kg=70.0,
+        heart_rate_bpm=40_000,
+        time_ns=20,
+        validate=False
+    )
+
+    with pytest.raises(OverflowError):
+        repository._save_many_sync([make_reading(10), bad])
+
+    assert repository.get_statistics() == {
+        "total_readings": 1,
+        "total_devices": 1,
+        "devices": {"device-1": 1}
+    }
+    assert repository._find_by_id_sync(bad.reading_id) is None
+
+
+def test_saving_a_stored_reading_id_again_is_rejected():
+    repository = InMemoryVitalRepository(max_readings_per_device=2)
+    reading = repository._save_sync(make_reading(10))
+
+    with pytest.raises(ValueError):
+        repository._save_sync(reading)
+    with pytest.raises(ValueError):
+        repository._save_many_sync([make_reading(20), reading])
+    for time_ns in (30, 40, 50):
+        repository._save_sync(make_reading(time_ns))
+
+    assert repository.get_statistics()["devices"] == {"device-1": 4}
+    assert len(repository._reading_devices) == 2
+
+
+def test_save_many_rejects_duplicate_ids_within_a_batch():
+    repository = InMemoryVitalRepository()
+    reading = make_reading(10)
+
+    with pytest.raises(ValueError):
+        repository._save_many_sync([reading, reading])
+
+    assert repository.get_statistics()["total_devices"] == 0
+    assert repository._reading_devices == {}
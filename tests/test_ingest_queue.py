@@ -0,0 +1,110 @@
+"""
+Tests - Ingest Queue Service
+
+Write-behind persistence of VitalIngestQueue: producer completion,
+per-device failure isolation, shutdown draining and event-loop fairness.
+"""
+
+import asyncio
+import logging
+
+import pytest
+
+from vital_monitoring.application.services.ingest_queue import VitalIngestQueue
+from vital_monitoring.domain.entities.vitals_reading import VitalReading
+from vital_monitoring.infrastructure.persistence.in_memory_vitals_repository import (
+    InMemoryVitalRepository
+)
+
+
+def make_reading(device_id: str = "device-1", weight_kg: float = 70.0) -> VitalReading:
+    """Build a reading; a NaN weight cannot be stored by the repository"""
+    return VitalReading(
+        device_id=device_id,
+        weight_kg=weight_kg,
+        heart_rate_bpm=70,
+        validate=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_waiting_producer_resolves_once_saved():
+    repository = InMemoryVitalRepository()
+    queue = VitalIngestQueue(repository)
+    queue.start()
+    reading = make_reading()
+
+    await queue.put(reading)
+
+    assert repository._find_by_id_sync(reading.reading_id) == reading
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_failing_device_only_fails_its_own_producers():
+    repository = InMemoryVitalRepository()
+    queue = VitalIngestQueue(repository)
+    queue.start()
+    good, bad, other = (
+        make_reading("device-1"),
+        make_reading("device-2", weight_kg=float("nan")),
+        make_reading("device-3")
+    )
+
+    results = await asyncio.gather(
+        queue.put(good), queue.put(bad), queue.put(other),
+        return_exceptions=True
+    )
+
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], ValueError)
+    assert repository.get_statistics()["devices"] == {"device-1": 1, "device-3": 1}
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_failure_is_logged(caplog):
+    repository = InMemoryVitalRepository()
+    queue = VitalIngestQueue(repository)
+    queue.start()
+    bad = make_reading(weight_kg=float("nan"))
+
+    with caplog.at_level(logging.ERROR):
+        await queue.put(bad, wait=False)
+        await queue.stop()
+
+    assert f"Failed to save reading {bad.reading_id}" in caplog.text
+    assert repository.get_statistics()["total_readings"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stop_persists_queued_readings():
+    repository = InMemoryVitalRepository()
+    queue = VitalIngestQueue(repository, batch_size=4)
+    queue.start()
+    readings = [make_reading(f"device-{i % 3}") for i in range(10)]
+
+    for reading in readings:
+        await queue.put(reading, wait=False)
+    await queue.stop()
+
+    assert repository.get_statistics()["total_readings"] == 10
+    for reading in readings:
+        assert repository._find_by_id_sync(reading.reading_id) == reading
+
+
+@pytest.mark.asyncio
+async def test_drain_yields_to_the_event_loop_between_batches():
+    repository = InMemoryVitalRepository()
+    queue = VitalIngestQueue(repository, batch_size=2)
+    queue.start()
+    for _ in range(10):
+        await queue.put(make_reading(), wait=False)
+
+    async def probe():
+        return repository.get_statistics()["total_readings"]
+
+    observed = asyncio.create_task(probe())
+    await queue.stop()
+
+    assert await observed < 10
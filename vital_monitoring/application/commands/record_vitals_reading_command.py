@@ -6,17 +6,21 @@ Commands change the state of the system.
 """
 
 from dataclasses import dataclass
+from typing import Optional
+from vital_monitoring.application.services.ingest_queue import VitalIngestQueue
 from vital_monitoring.domain.entities.vitals_reading import VitalReading
 from vital_monitoring.domain.repositories.vitals_repository import IVitalRepository
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RecordVitalReadingCommand:
     """
     Command: Record a new vital reading from IoT device
 
     This command represents the intent to record a new vital parameters
     reading in the system. It encapsulates all the data needed for the operation.
+    Its values come from a validated VitalReadingDto and are trusted as-is.
+    Commands are immutable and slotted (no per-instance __dict__).
 
     Attributes:
         device_id: Identifier of the IoT device
@@ -36,60 +40,76 @@ class RecordVitalReadingCommandHandler:
     It follows the Command Handler pattern from CQRS.
 
     Responsibilities:
-    - Validate command data
-    - Create domain entity
+    - Create domain entity from validated command data
     - Apply business rules
-    - Persist through repository
+    - Persist through repository (or the ingest queue when given)
     - Return result
     """
 
-    def __init__(self, repository: IVitalRepository):
+    def __init__(
+            self,
+            repository: IVitalRepository,
+            ingest_queue: Optional[VitalIngestQueue] = None
+    ):
         """
         Initialize handler with repository dependency
 
         Args:
             repository: Implementation of IVitalRepository
+            ingest_queue: Optional write-behind queue in front of the repository
         """
         self.repository = repository
-
-    async def handle(self, command: RecordVitalReadingCommand) -> dict:
+        self.ingest_queue = ingest_queue
+
+    async def handle(
+            self,
+            command: RecordVitalReadingCommand,
+            full: bool = False,
+            wait: bool = True
+    ) -> dict:
         """
         Handle the command to record a vital reading
 
         This method orchestrates the use case:
-        1. Create VitalReading entity (applies domain rules)
+        1. Create VitalReading entity (classified lazily, on first use)
         2. Persist through repository
         3. Return success result
 
         Args:
             command: RecordVitalReadingCommand with reading data
+            full: Return the whole entity representation instead of
+                the minimal acknowledgement
+            wait: Wait until the reading is persisted; False only
+                enqueues it (fire-and-forget)
 
         Returns:
-            Dictionary with operation result
+            Dictionary with reading_id and is_critical, or the full
+            reading when requested
 
-        Raises:
-            ValueError: If domain rules are violated
         """
 
-        # Create domain entity - domain rules are applied in __post_init__
-        vital_reading = VitalReading(
+        # Create domain entity - the DTO already validated the invariants
+        vital_reading = VitalReading.from_trusted(
             device_id=command.device_id,
             weight_kg=command.weight_kg,
             heart_rate_bpm=command.heart_rate_bpm
         )
 
-        # Persist through repository
-        saved_reading = await self.repository.save(vital_reading)
-
-        # Return result
-        return {
-            "reading_id": saved_reading.reading_id,
-            "device_id": saved_reading.device_id,
-            "weight_kg": saved_reading.weight_kg,
-            "heart_rate_bpm": saved_reading.heart_rate_bpm,
-            "heart_rate_status": saved_reading.heart_rate_status.value,
-            "weight_alert": saved_reading.weight_alert.value,
-            "is_critical": saved_reading.is_critical(),
-            "requires_medical_attention": saved_reading.requires_medical_attention(),
-            "timestamp": saved_reading.timestamp.isoformat()
-        }
\ No newline at end of file
+        # Persist through the ingest queue, or the repository directly
+        if self.ingest_queue is not None:
+            await self.ingest_queue.put(vital_reading, wait=wait)
+            saved_reading = vital_reading
+        else:
+            saved_reading = await self.repository.save(vital_reading)
+
+        if not full:
+            # Minimal acknowledgement for the ingest hot path
+            return {
+                "reading_id": saved_reading.reading_id,
+                "is_critical": saved_reading.is_critical()
+            }
+
+        # Return result (entity representation without recorded_at)
+        result = saved_reading.to_dict()
+        del result["recorded_at"]
+        return result
@@ -6,8 +6,10 @@ Queries retrieve data without modifying system state.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
+from vital_monitoring.domain.entities.vitals_reading import VitalReading
 from vital_monitoring.domain.repositories.vitals_repository import IVitalRepository
 
 
@@ -25,6 +27,50 @@ class GetDeviceStatusQuery:
     device_id: str
 
 
+@lru_cache(maxsize=4096)
+def _build_status_payload(
+        device_id: str,
+        reading_id: str,
+        weight_kg: float,
+        heart_rate_bpm: int,
+        time_ns: int,
+        total_readings: int
+) -> dict:
+    """
+    Build the device status response for a given latest reading
+
+    The payload only changes when a new reading arrives (new reading_id
+    and count), so it is cached process-wide. The returned dict is shared
+    between callers and must be treated as read-only.
+    """
+    latest_reading = VitalReading(
+        device_id=device_id,
+        weight_kg=weight_kg,
+        heart_rate_bpm=heart_rate_bpm,
+        reading_id=reading_id,
+        time_ns=time_ns,
+        validate=False
+    )
+
+    reading = latest_reading.to_dict()
+
+    return {
+        "device_id": device_id,
+        "is_active": True,
+        "last_contact": reading["timestamp"],
+        "total_readings": total_readings,
+        "current_status": {
+            "weight_kg": reading["weight_kg"],
+            "heart_rate_bpm": reading["heart_rate_bpm"],
+            "heart_rate_status": reading["heart_rate_status"],
+            "weight_alert": reading["weight_alert"],
+            "is_critical": reading["is_critical"],
+            "requires_medical_attention": reading["requires_medical_attention"]
+        },
+        "latest_reading": reading
+    }
+
+
 class GetDeviceStatusQueryHandler:
     """
     Query Handler: Processes GetDeviceStatusQuery
@@ -55,7 +101,7 @@ class GetDeviceStatusQueryHandler:
         This method:
         1. Retrieves latest reading for the device
         2. Gets total readings count
-        3. Constructs status response
+        3. Returns the (cached) status response for that reading
 
         Args:
             query: GetDeviceStatusQuery with device_id
@@ -75,19 +121,12 @@ class GetDeviceStatusQueryHandler:
         # Get total readings count
         total_readings = await self.repository.count_by_device(query.device_id)
 
-        # Construct response
-        return {
-            "device_id": query.device_id,
-            "is_active": True,
-            "last_contact": latest_reading.timestamp.isoformat(),
-            "total_readings": total_readings,
-            "current_status": {
-                "weight_kg": latest_reading.weight_kg,
-                "heart_rate_bpm": latest_reading.heart_rate_bpm,
-                "heart_rate_status": latest_reading.heart_rate_status.value,
-                "weight_alert": latest_reading.weight_alert.value,
-                "is_critical": latest_reading.is_critical(),
-                "requires_medical_attention": latest_reading.requires_medical_attention()
-            },
-            "latest_reading": latest_reading.to_dict()
-        }
\ No newline at end of file
+        # Construct response (rebuilt only when a new reading arrives)
+        return _build_status_payload(
+            query.device_id,
+            latest_reading.reading_id,
+            latest_reading.weight_kg,
+            latest_reading.heart_rate_bpm,
+            latest_reading.time_ns,
+            total_readings
+        )
\ No newline at end of file
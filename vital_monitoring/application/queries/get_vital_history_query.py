@@ -6,6 +6,12 @@ Retrieves historical vital readings for a device.
 
 from dataclasses import dataclass
 from typing import List
+from vital_monitoring.domain.entities._batch import classify_batch
+from vital_monitoring.domain.entities.vitals_reading import (
+    HEART_RATE_STATUSES,
+    WEIGHT_ALERTS
+)
+from vital_monitoring.domain.services.clock import iso_from_ns
 from vital_monitoring.domain.repositories.vitals_repository import IVitalRepository
 
 
@@ -27,6 +33,8 @@ class GetVitalHistoryQueryHandler:
     Query Handler: Processes GetVitalHistoryQuery
 
     Retrieves historical data for analysis and monitoring purposes.
+    Readings are fetched as columns and classified in a single batch
+    instead of serializing one entity at a time.
     """
 
     def __init__(self, repository: IVitalRepository):
@@ -49,11 +57,42 @@ class GetVitalHistoryQueryHandler:
             List of vital readings as dictionaries
         """
 
-        # Retrieve readings from repository
-        readings = await self.repository.find_by_device(
+        # Retrieve readings from repository as columns
+        columns = await self.repository.find_by_device_arrays(
             device_id=query.device_id,
             limit=query.limit
         )
 
-        # Transform to dictionary format
-        return [reading.to_dict() for reading in readings]
\ No newline at end of file
+        # Classify all readings at once
+        hr_codes, wa_codes, critical, attention = classify_batch(
+            columns.weights, columns.heart_rates
+        )
+
+        # Transform to dictionary format (same shape as VitalReading.to_dict)
+        return [
+            {
+                "reading_id": reading_id,
+                "device_id": columns.device_id,
+                "weight_kg": weight_kg,
+                "heart_rate_bpm": heart_rate_bpm,
+                "heart_rate_status": HEART_RATE_STATUSES[hr_code],
+                "weight_alert": WEIGHT_ALERTS[wa_code],
+                "is_critical": is_critical,
+                "requires_medical_attention": requires_attention,
+                "timestamp": timestamp,
+                "recorded_at": timestamp
+            }
+            for (
+                reading_id, weight_kg, heart_rate_bpm, hr_code, wa_code,
+                is_critical, requires_attention, timestamp
+            ) in zip(
+                columns.reading_ids,
+                columns.weights.tolist(),
+                columns.heart_rates.tolist(),
+                hr_codes.tolist(),
+                wa_codes.tolist(),
+                critical.tolist(),
+                attention.tolist(),
+                map(iso_from_ns, columns.timestamps.tolist())
+            )
+        ]
\ No newline at end of file
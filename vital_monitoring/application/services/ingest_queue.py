@@ -0,0 +1,128 @@
+"""
+Application Layer - Ingest Queue Service
+
+Producer/consumer queue between the ingest endpoints and the repository.
+Requests build and classify the VitalReading entity, enqueue it, and a
+single background task drains the queue into the repository in batches,
+smoothing bursty IoT traffic.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from vital_monitoring.domain.entities.vitals_reading import VitalReading
+from vital_monitoring.domain.repositories.vitals_repository import IVitalRepository
+
+logger = logging.getLogger(__name__)
+
+_QueueItem = Tuple[VitalReading, Optional[asyncio.Future]]
+
+
+class VitalIngestQueue:
+    """
+    Application Service: Write-behind queue for vital readings
+
+    Producers either wait until their reading is persisted (wait=True)
+    or return immediately (fire-and-forget). Until start() is called,
+    e.g. outside the application lifespan, put() saves directly.
+    """
+
+    def __init__(
+            self,
+            repository: IVitalRepository,
+            maxsize: int = 10_000,
+            batch_size: int = 256
+    ):
+        """
+        Initialize the queue service
+
+        Args:
+            repository: Implementation of IVitalRepository to drain into
+            maxsize: Maximum queued readings before producers back off
+            batch_size: Maximum readings persisted per drain iteration
+        """
+        self.repository = repository
+        self._maxsize = maxsize
+        self._batch_size = batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Create the queue and spawn the drain task on the running loop"""
+        self._queue = asyncio.Queue(maxsize=self._maxsize)
+        self._task = asyncio.create_task(self._drain())
+
+    async def stop(self):
+        """Persist everything still queued, then stop the drain task"""
+        if self._task is None:
+            return
+
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._queue = self._task = None
+
+    async def put(self, vital_reading: VitalReading, wait: bool = True):
+        """
+        Enqueue a reading for persistence
+
+        Args:
+            vital_reading: Classified VitalReading entity
+            wait: Whether to wait until the reading has been saved
+        """
+        if self._task is None:
+            await self.repository.save(vital_reading)
+            return
+
+        future = asyncio.get_running_loop().create_future() if wait else None
+        await self._queue.put((vital_reading, future))
+        if future is not None:
+            await future
+
+    async def _drain(self):
+        """Consumer: pop up to batch_size readings at a time and save them per device"""
+        while True:
+            batch: List[_QueueItem] = [await self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            # Persist each device's readings in one repository call, so a
+            # failing device only fails the producers of its own readings
+            by_device: Dict[str, List[_QueueItem]] = {}
+            for item in batch:
+                by_device.setdefault(item[0].device_id, []).append(item)
+
+            for items in by_device.values():
+                error: Optional[Exception] = None
+                try:
+                    await self.repository.save_many(
+                        [vital_reading for vital_reading, _ in items]
+                    )
+                except Exception as e:
+                    error = e
+
+                for vital_reading, future in items:
+                    if future is None:
+                        if error is not None:
+                            logger.error(
+                                "Failed to save reading %s: %s",
+                                vital_reading.reading_id,
+                                error
+                            )
+                    elif not future.done():
+                        if error is not None:
+                            future.set_exception(error)
+                        else:
+                            future.set_result(None)
+                    self._queue.task_done()
+
+            # get() and save_many() complete without suspending while the
+            # queue is backed up, so hand the loop a turn between batches
+            await asyncio.sleep(0)
@@ -0,0 +1,46 @@
+"""
+Domain Layer - Batch Vital Classification
+Bounded Context: Vital Monitoring
+
+Vectorized counterpart of VitalReading classification for read paths
+that serialize many readings at once.
+"""
+
+import numpy as np
+from numba import njit
+
+from vital_monitoring.domain.entities.vitals_reading import _classify_kernel
+
+
+@njit(cache=True, fastmath=True)
+def classify_batch(weights, heart_rates):
+    """
+    Business Logic: Classify N readings in a single compiled loop
+
+    Applies the same thresholds as VitalReading (via _classify_kernel)
+    to parallel arrays of weights and heart rates.
+
+    Args:
+        weights: float array of weights in kilograms
+        heart_rates: integer array of heart rates in BPM
+
+    Returns:
+        (heart_rate_codes, weight_alert_codes, is_critical, requires_attention)
+        (codes index HEART_RATE_STATUSES and WEIGHT_ALERTS)
+    """
+    n = weights.shape[0]
+    hr_codes = np.empty(n, dtype=np.int64)
+    wa_codes = np.empty(n, dtype=np.int64)
+    critical = np.empty(n, dtype=np.bool_)
+    attention = np.empty(n, dtype=np.bool_)
+
+    for i in range(n):
+        hr_code, wa_code, is_critical, requires_attention = _classify_kernel(
+            weights[i], heart_rates[i]
+        )
+        hr_codes[i] = hr_code
+        wa_codes[i] = wa_code
+        critical[i] = is_critical == 1
+        attention[i] = requires_attention == 1
+
+    return hr_codes, wa_codes, critical, attention
@@ -6,27 +6,103 @@ This is the core domain entity representing a vital parameters reading
 from a Smart LifeWatching device.
 """
 
-import uuid
-from dataclasses import dataclass, field
-from datetime import datetime
-from enum import Enum
-from typing import Optional
+import itertools
+import os
+import time
+from dataclasses import InitVar, dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import StrEnum
+from typing import List, Optional
 
+import numpy as np
+from numba import float64, int64, njit
+from numba.types import UniTuple
 
-class HeartRateStatus(Enum):
+from vital_monitoring.domain.services.clock import iso_from_ns
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class InvalidVitalReadingError(ValueError):
+    """Domain Error: a reading violates a business rule"""
+
+
+class HeartRateStatus(StrEnum):
     """Value Object: Heart Rate Status Classification"""
     LOW = "Low"
     NORMAL = "Normal"
     HIGH = "High"
 
 
-class WeightAlert(Enum):
+class WeightAlert(StrEnum):
     """Value Object: Weight Alert Classification"""
     NORMAL = "Normal"
     OVERWEIGHT = "Overweight"
 
 
-@dataclass
+# Reading ids are "<pid>-<counter>" in hex. The counter is seeded from the
+# clock so ids stay unique across restarts and worker processes without
+# the os.urandom() call and dash formatting of str(uuid.uuid4()).
+_reading_prefix = f"{os.getpid():x}-"
+_reading_counter = itertools.count(time.time_ns())
+
+
+def _reseed_reading_ids():
+    """Give a forked worker its own id prefix and counter"""
+    global _reading_prefix, _reading_counter
+    _reading_prefix = f"{os.getpid():x}-"
+    _reading_counter = itertools.count(time.time_ns())
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_reading_ids)
+
+
+def _next_reading_id() -> str:
+    """Generate a process-unique reading id"""
+    return f"{_reading_prefix}{next(_reading_counter):x}"
+
+
+# Classification codes produced by _classify_kernel (and classify_batch)
+# index these tuples
+HEART_RATE_STATUSES = (
+    HeartRateStatus.LOW, HeartRateStatus.NORMAL, HeartRateStatus.HIGH
+)
+WEIGHT_ALERTS = (WeightAlert.NORMAL, WeightAlert.OVERWEIGHT)
+
+
+@njit(UniTuple(int64, 4)(float64, int64), cache=True, fastmath=True)
+def _classify_kernel(weight_kg, heart_rate_bpm):
+    """
+    Business Logic: Classify a reading in a single compiled pass
+
+    Medical thresholds:
+    - Heart rate Low (Bradycardia): < 60 BPM
+    - Heart rate Normal: 60-100 BPM
+    - Heart rate High (Tachycardia): > 100 BPM
+    - Weight > 80 kg triggers overweight alert
+    - Critical: abnormal heart rate or overweight
+    - Medical attention: < 40 BPM (severe bradycardia)
+      or > 120 BPM (severe tachycardia)
+
+    Returns:
+        (heart_rate_code, weight_alert_code, is_critical, requires_attention)
+    """
+    if heart_rate_bpm < 60:
+        hr_code = 0
+    elif heart_rate_bpm <= 100:
+        hr_code = 1
+    else:
+        hr_code = 2
+
+    wa_code = 1 if weight_kg > 80 else 0
+    is_critical = 1 if hr_code != 1 or wa_code == 1 else 0
+    requires_attention = 1 if heart_rate_bpm < 40 or heart_rate_bpm > 120 else 0
+
+    return hr_code, wa_code, is_critical, requires_attention
+
+
+@dataclass(slots=True)
 class VitalReading:
     """
     Aggregate Root: VitalReading
@@ -37,76 +113,119 @@ class VitalReading:
     Attributes:
         reading_id: Unique identifier for the reading
         device_id: Identifier of the IoT device that generated the reading
-        weight_kg: Patient's weight in kilograms
+        weight_kg: Patient's weight in kilograms (0.1 kg resolution)
         heart_rate_bpm: Heart rate in beats per minute
-        heart_rate_status: Classification of heart rate (Low/Normal/High)
-        weight_alert: Weight alert status
-        timestamp: When the reading was taken
-        recorded_at: When the reading was recorded in the system
+        heart_rate_status: Classification of heart rate (Low/Normal/High), derived
+        weight_alert: Weight alert status, derived
+        time_ns: When the reading was taken and recorded (epoch nanoseconds, UTC);
+            at the edge both instants are the same
+        validate: Whether to enforce the invariants (False for trusted input)
     """
 
     device_id: str
     weight_kg: float
     heart_rate_bpm: int
-    reading_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    recorded_at: datetime = field(default_factory=datetime.utcnow)
-    heart_rate_status: Optional[HeartRateStatus] = None
-    weight_alert: Optional[WeightAlert] = None
+    reading_id: str = field(default_factory=_next_reading_id)
+    time_ns: int = field(default_factory=time.time_ns)
+    validate: InitVar[bool] = True
+    # Derived classification, computed on first use (_hr_code -1 = not yet)
+    _hr_code: int = field(default=-1, init=False, repr=False, compare=False)
+    _wa_code: int = field(default=0, init=False, repr=False, compare=False)
+    _critical: bool = field(default=False, init=False, repr=False, compare=False)
+    _requires_attention: bool = field(default=False, init=False, repr=False, compare=False)
 
-    def __post_init__(self):
+    def __post_init__(self, validate: bool):
         """Post-initialization: Apply business rules and validate invariants"""
-        self._validate_device_id()
-        self._validate_weight()
-        self._validate_heart_rate()
-        self._classify_heart_rate()
-        self._classify_weight()
+        # Business Rule: weights are measured to 0.1 kg. Rounding here, before
+        # anything classifies the reading, keeps the entity, its stored row
+        # and every rehydrated copy in agreement (the DTO rounds the same way)
+        self.weight_kg = round(self.weight_kg, 1)
+        if validate:
+            self._validate_device_id()
+            self._validate_weight()
+            self._validate_heart_rate()
+
+    @classmethod
+    def from_trusted(
+            cls,
+            device_id: str,
+            weight_kg: float,
+            heart_rate_bpm: int
+    ) -> "VitalReading":
+        """
+        Factory: Create a reading from already-validated input
+
+        The API DTO enforces the same bounds as the _validate_* rules, so
+        readings built from it skip validation.
+
+        Args:
+            device_id: Identifier of the IoT device
+            weight_kg: Patient's weight in kilograms
+            heart_rate_bpm: Heart rate in beats per minute
+
+        Returns:
+            VitalReading entity
+        """
+        return cls(
+            device_id=device_id,
+            weight_kg=weight_kg,
+            heart_rate_bpm=heart_rate_bpm,
+            validate=False
+        )
 
     def _validate_device_id(self):
         """Business Rule: Device ID must not be empty"""
         if not self.device_id or not self.device_id.strip():
-            raise ValueError("Device ID cannot be empty")
+            raise InvalidVitalReadingError("Device ID cannot be empty")
 
     def _validate_weight(self):
         """Business Rule: Weight must be within realistic bounds"""
         if self.weight_kg < 0:
-            raise ValueError("Weight cannot be negative")
+            raise InvalidVitalReadingError("Weight cannot be negative")
         if self.weight_kg > 300:
-            raise ValueError("Weight exceeds maximum realistic value (300kg)")
+            raise InvalidVitalReadingError("Weight exceeds maximum realistic value (300kg)")
 
     def _validate_heart_rate(self):
         """Business Rule: Heart rate must be within physiological bounds"""
         if self.heart_rate_bpm < 30:
-            raise ValueError("Heart rate too low (minimum: 30 BPM)")
+            raise InvalidVitalReadingError("Heart rate too low (minimum: 30 BPM)")
         if self.heart_rate_bpm > 220:
-            raise ValueError("Heart rate too high (maximum: 220 BPM)")
+            raise InvalidVitalReadingError("Heart rate too high (maximum: 220 BPM)")
 
-    def _classify_heart_rate(self):
+    def _classify(self):
         """
-        Business Logic: Classify heart rate status
+        Business Logic: Classify heart rate and weight (see _classify_kernel)
 
-        Medical thresholds:
-        - Low (Bradycardia): < 60 BPM
-        - Normal: 60-100 BPM
-        - High (Tachycardia): > 100 BPM
-        """
-        if self.heart_rate_bpm < 60:
-            self.heart_rate_status = HeartRateStatus.LOW
-        elif 60 <= self.heart_rate_bpm <= 100:
-            self.heart_rate_status = HeartRateStatus.NORMAL
-        else:
-            self.heart_rate_status = HeartRateStatus.HIGH
-
-    def _classify_weight(self):
+        Runs lazily, at most once per entity: the result is a pure function
+        of the immutable vitals, so it is cached on the instance. Readings
+        rehydrated by the repository and never inspected skip the kernel.
         """
-        Business Logic: Classify weight alert
+        hr_code, wa_code, critical, attention = _classify_kernel(
+            self.weight_kg, self.heart_rate_bpm
+        )
+        self._hr_code = hr_code
+        self._wa_code = wa_code
+        self._critical = critical == 1
+        self._requires_attention = attention == 1
 
-        Threshold: > 80 kg triggers overweight alert
-        """
-        if self.weight_kg > 80:
-            self.weight_alert = WeightAlert.OVERWEIGHT
-        else:
-            self.weight_alert = WeightAlert.NORMAL
+    @property
+    def timestamp(self) -> datetime:
+        """When the reading was taken (UTC)"""
+        return _EPOCH + timedelta(microseconds=self.time_ns // 1000)
+
+    @property
+    def heart_rate_status(self) -> HeartRateStatus:
+        """Classification of heart rate (Low/Normal/High)"""
+        if self._hr_code < 0:
+            self._classify()
+        return HEART_RATE_STATUSES[self._hr_code]
+
+    @property
+    def weight_alert(self) -> WeightAlert:
+        """Weight alert status"""
+        if self._hr_code < 0:
+            self._classify()
+        return WEIGHT_ALERTS[self._wa_code]
 
     def is_critical(self) -> bool:
         """
@@ -115,10 +234,9 @@ class VitalReading:
         Returns:
             True if heart rate is abnormal or weight is critical
         """
-        return (
-                self.heart_rate_status in [HeartRateStatus.LOW, HeartRateStatus.HIGH]
-                or self.weight_alert == WeightAlert.OVERWEIGHT
-        )
+        if self._hr_code < 0:
+            self._classify()
+        return self._critical
 
     def requires_medical_attention(self) -> bool:
         """
@@ -127,24 +245,24 @@ class VitalReading:
         Returns:
             True if heart rate is critically abnormal
         """
-        return (
-                self.heart_rate_bpm < 40  # Severe bradycardia
-                or self.heart_rate_bpm > 120  # Severe tachycardia
-        )
+        if self._hr_code < 0:
+            self._classify()
+        return self._requires_attention
 
     def to_dict(self) -> dict:
         """Convert entity to dictionary representation"""
+        timestamp = iso_from_ns(self.time_ns)
         return {
             "reading_id": self.reading_id,
             "device_id": self.device_id,
             "weight_kg": self.weight_kg,
             "heart_rate_bpm": self.heart_rate_bpm,
-            "heart_rate_status": self.heart_rate_status.value if self.heart_rate_status else None,
-            "weight_alert": self.weight_alert.value if self.weight_alert else None,
+            "heart_rate_status": self.heart_rate_status,
+            "weight_alert": self.weight_alert,
             "is_critical": self.is_critical(),
             "requires_medical_attention": self.requires_medical_attention(),
-            "timestamp": self.timestamp.isoformat(),
-            "recorded_at": self.recorded_at.isoformat()
+            "timestamp": timestamp,
+            "recorded_at": timestamp
         }
 
 
@@ -171,4 +289,21 @@ class DeviceStatus:
             "last_contact": self.last_contact.isoformat(),
             "total_readings": self.total_readings,
             "last_reading": self.last_reading.to_dict() if self.last_reading else None
-        }
\ No newline at end of file
+        }
+
+
+@dataclass
+class VitalReadingColumns:
+    """
+    Value Object: Column-oriented view of a device's readings
+
+    Parallel sequences ordered by timestamp (most recent first). Numeric
+    vitals and epoch-nanosecond timestamps are NumPy arrays so they can be
+    processed in one batch.
+    """
+
+    device_id: str
+    reading_ids: List[str]
+    weights: np.ndarray
+    heart_rates: np.ndarray
+    timestamps: np.ndarray
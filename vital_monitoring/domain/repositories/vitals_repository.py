@@ -7,8 +7,11 @@ specifying the implementation (DDD Repository Pattern).
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from vital_monitoring.domain.entities.vitals_reading import VitalReading
+from typing import List, Optional, Sequence
+from vital_monitoring.domain.entities.vitals_reading import (
+    VitalReading,
+    VitalReadingColumns
+)
 
 
 class IVitalRepository(ABC):
@@ -33,6 +36,26 @@ class IVitalRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_many(
+            self,
+            vital_readings: Sequence[VitalReading]
+    ) -> List[VitalReading]:
+        """
+        Persist several vital readings in one call
+
+        The readings of each device are saved all-or-nothing; if one
+        device's readings fail, readings of other devices in the same
+        call may already have been saved.
+
+        Args:
+            vital_readings: The VitalReading entities to save
+
+        Returns:
+            The saved VitalReading entities
+        """
+        pass
+
     @abstractmethod
     async def find_by_id(self, reading_id: str) -> Optional[VitalReading]:
         """
@@ -64,6 +87,24 @@ class IVitalRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_by_device_arrays(
+            self,
+            device_id: str,
+            limit: int = 50
+    ) -> VitalReadingColumns:
+        """
+        Find vital readings for a device as parallel columns
+
+        Args:
+            device_id: Identifier of the IoT device
+            limit: Maximum number of readings to return
+
+        Returns:
+            VitalReadingColumns ordered by timestamp (most recent first)
+        """
+        pass
+
     @abstractmethod
     async def find_latest_by_device(
             self,
@@ -96,15 +137,18 @@ class IVitalRepository(ABC):
     @abstractmethod
     async def find_critical_readings(
             self,
-            device_id: Optional[str] = None
+            device_id: Optional[str] = None,
+            limit: Optional[int] = None
     ) -> List[VitalReading]:
         """
         Find all critical vital readings
 
         Args:
             device_id: Optional device filter
+            limit: Optional maximum number of readings to return
 
         Returns:
-            List of critical VitalReading entities
+            List of critical VitalReading entities, ordered by timestamp
+            (most recent first)
         """
         pass
\ No newline at end of file
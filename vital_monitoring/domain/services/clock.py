@@ -0,0 +1,48 @@
+"""
+Domain Layer - Clock Service
+Bounded Context: Vital Monitoring
+
+Timestamps are kept as integer nanoseconds since the epoch (UTC) and
+only formatted as ISO-8601 strings when serialized. The formatted
+date/time part is cached per second, so repeated calls within the same
+second only append the sub-second digits.
+"""
+
+import time
+
+# (epoch_second, "YYYY-MM-DDTHH:MM:SS", "YYYY-MM-DDTHH:MM:SSZ"), swapped atomically
+_second_cache = (-1, "", "")
+
+
+def _format_second(epoch_second: int) -> tuple:
+    """Return the cached formatting entry for an epoch second"""
+    global _second_cache
+    cached = _second_cache
+    if cached[0] != epoch_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(epoch_second))
+        cached = _second_cache = (epoch_second, prefix, prefix + "Z")
+    return cached
+
+
+def iso_now() -> str:
+    """
+    Current UTC time as an ISO-8601 string with second resolution
+
+    Returns:
+        e.g. "2025-11-19T10:30:00Z"
+    """
+    return _format_second(int(time.time()))[2]
+
+
+def iso_from_ns(timestamp_ns: int) -> str:
+    """
+    Format epoch nanoseconds as an ISO-8601 UTC string with microseconds
+
+    Args:
+        timestamp_ns: Nanoseconds since the epoch (UTC)
+
+    Returns:
+        e.g. "2025-11-19T10:30:00.123456Z"
+    """
+    epoch_second, remainder = divmod(timestamp_ns, 1_000_000_000)
+    return f"{_format_second(epoch_second)[1]}.{remainder // 1000:06d}Z"
@@ -5,7 +5,7 @@ DTOs are used for API contracts and data transfer between layers.
 They are separate from domain entities to maintain clean architecture.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional
 
 
@@ -22,12 +22,22 @@ class VitalReadingDto(BaseModel):
         heart_rate_bpm: Heart rate in beats per minute (30-220)
     """
 
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "device_id": "LIFEWATCHING-001",
+                "weight_kg": 75.3,
+                "heart_rate_bpm": 72
+            }
+        }
+    )
+
     device_id: str = Field(
         ...,
         description="Unique identifier of the IoT device",
         min_length=1,
         max_length=100,
-        example="DEVICE-001"
+        examples=["DEVICE-001"]
     )
 
     weight_kg: float = Field(
@@ -35,7 +45,7 @@ class VitalReadingDto(BaseModel):
         description="Patient's weight in kilograms",
         ge=0,
         le=300,
-        example=75.5
+        examples=[75.5]
     )
 
     heart_rate_bpm: int = Field(
@@ -43,43 +53,23 @@ class VitalReadingDto(BaseModel):
         description="Heart rate in beats per minute",
         ge=30,
         le=220,
-        example=72
+        examples=[72]
     )
 
-    @validator('device_id')
-    def validate_device_id(cls, v):
+    @field_validator('device_id')
+    @classmethod
+    def validate_device_id(cls, v: str) -> str:
         """Validate device_id is not empty or whitespace"""
-        if not v or not v.strip():
+        if not v.strip():
             raise ValueError('device_id cannot be empty')
         return v.strip()
 
-    @validator('weight_kg')
-    def validate_weight(cls, v):
-        """Validate weight is realistic"""
-        if v < 0:
-            raise ValueError('Weight cannot be negative')
-        if v > 300:
-            raise ValueError('Weight exceeds maximum realistic value')
+    @field_validator('weight_kg')
+    @classmethod
+    def validate_weight(cls, v: float) -> float:
+        """Round weight to the device resolution (bounds are enforced by Field)"""
         return round(v, 1)  # Round to 1 decimal place
 
-    @validator('heart_rate_bpm')
-    def validate_heart_rate(cls, v):
-        """Validate heart rate is within physiological bounds"""
-        if v < 30:
-            raise ValueError('Heart rate too low (minimum: 30 BPM)')
-        if v > 220:
-            raise ValueError('Heart rate too high (maximum: 220 BPM)')
-        return v
-
-    class Config:
-        schema_extra = {
-            "example": {
-                "device_id": "LIFEWATCHING-001",
-                "weight_kg": 75.3,
-                "heart_rate_bpm": 72
-            }
-        }
-
 
 class DeviceStatusDto(BaseModel):
     """
@@ -88,17 +78,8 @@ class DeviceStatusDto(BaseModel):
     Used to return device status information to API consumers.
     """
 
-    device_id: str
-    is_active: bool
-    last_contact: str
-    total_readings: int
-    current_weight_kg: Optional[float]
-    current_heart_rate_bpm: Optional[int]
-    heart_rate_status: Optional[str]
-    weight_alert: Optional[str]
-
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "device_id": "LIFEWATCHING-001",
                 "is_active": True,
@@ -109,4 +90,14 @@ class DeviceStatusDto(BaseModel):
                 "heart_rate_status": "Normal",
                 "weight_alert": "Normal"
             }
-        }
\ No newline at end of file
+        }
+    )
+
+    device_id: str
+    is_active: bool
+    last_contact: str
+    total_readings: int
+    current_weight_kg: Optional[float]
+    current_heart_rate_bpm: Optional[int]
+    heart_rate_status: Optional[str]
+    weight_alert: Optional[str]
@@ -0,0 +1,63 @@
+"""
+Infrastructure Layer - Internal Error Middleware
+
+Turns unhandled exceptions into JSON 500 responses inside the CORS layer,
+so browser clients can still read the error. Exception handlers registered
+for `Exception` run in Starlette's outermost ServerErrorMiddleware, where
+CORS headers are never added.
+"""
+
+import logging
+
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class InternalErrorMiddleware:
+    """
+    Catch-all error boundary for HTTP requests
+
+    Must be added before (inside) the CORS middleware. Errors raised after
+    the response has started cannot be replaced and are re-raised.
+
+    Attributes:
+        app: The wrapped ASGI application
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware
+
+        Args:
+            app: The ASGI application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the application and answer 500 if it fails before responding"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as exc:
+            if response_started:
+                raise
+            logger.exception("Unhandled error on %s", scope["path"])
+            response = ORJSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={"detail": f"Internal server error: {exc}"}
+            )
+            await response(scope, receive, send)
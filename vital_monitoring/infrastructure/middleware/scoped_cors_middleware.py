@@ -0,0 +1,52 @@
+"""
+Infrastructure Layer - Scoped CORS Middleware
+
+IoT devices talk to the API directly, not from a browser, so they never
+need CORS handling. This middleware only applies CORS to browser-facing
+routes and lets device traffic bypass it.
+"""
+
+from typing import Sequence
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ScopedCORSMiddleware:
+    """
+    CORS middleware that skips machine-to-machine paths
+
+    Requests whose path starts with one of the excluded prefixes go
+    straight to the application. Every other request is handled by the
+    standard Starlette CORSMiddleware with the given options.
+
+    Attributes:
+        app: The wrapped ASGI application
+        cors: CORSMiddleware instance wrapping the same application
+        exclude_prefixes: Path prefixes that bypass CORS
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            exclude_prefixes: Sequence[str] = (),
+            **cors_options
+    ):
+        """
+        Initialize the middleware
+
+        Args:
+            app: The ASGI application to wrap
+            exclude_prefixes: Path prefixes that bypass CORS handling
+            **cors_options: Options forwarded to CORSMiddleware
+        """
+        self.app = app
+        self.cors = CORSMiddleware(app, **cors_options)
+        self.exclude_prefixes = tuple(exclude_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Dispatch to the application directly or through CORS"""
+        if scope["type"] == "http" and scope["path"].startswith(self.exclude_prefixes):
+            await self.app(scope, receive, send)
+        else:
+            await self.cors(scope, receive, send)
@@ -6,30 +6,368 @@ in-memory storage. In production, this would be replaced with
 a database implementation (PostgreSQL, MongoDB, etc.).
 """
 
-from typing import List, Optional, Dict
+import logging
+from typing import List, Optional, Dict, Sequence, Tuple
 
-from vital_monitoring.domain.entities.vitals_reading import VitalReading
+import numpy as np
+
+from vital_monitoring.domain.entities.vitals_reading import (
+    VitalReading,
+    VitalReadingColumns
+)
 from vital_monitoring.domain.repositories.vitals_repository import IVitalRepository
 
+logger = logging.getLogger(__name__)
+
+_INITIAL_CAPACITY = 64
+_MAX_READINGS_PER_DEVICE = 10_000
+
+# Weights are stored as int16 tenths of a kilogram (the entity's
+# resolution; the 300 kg domain limit is 3000), a quarter of float64
+_WEIGHT_SCALE = 10
+_INT16_MIN, _INT16_MAX = -(1 << 15), (1 << 15) - 1
+
+
+class _DeviceBuffer:
+    """
+    Struct-of-Arrays storage for the readings of a single device
+
+    Each reading occupies one row across parallel typed arrays, which
+    grow by doubling. Only the reading ids are kept as Python objects.
+    The critical flag is stored as a column too; the entity classifies
+    itself on first use, at the latest when the row is encoded, so
+    critical lookups never reclassify.
+
+    Rows are kept ordered by timestamp (oldest first), so the most recent
+    readings are always the tail of the columns and queries never sort.
+    Inserts are synchronous (no await), so readers on the event loop
+    never observe a partially written row and need no lock.
+
+    The buffer holds at most `max_size` readings. Live rows are
+    [start, start + size); evicting the oldest reading only advances
+    `start`, and the evicted prefix is reclaimed when the columns are
+    compacted, so eviction is O(1) amortized.
+    """
+
+    __slots__ = (
+        "start",
+        "size",
+        "max_size",
+        "reading_ids",
+        "weights",
+        "heart_rates",
+        "timestamps",
+        "critical",
+        "critical_count"
+    )
+
+    def __init__(
+            self,
+            capacity: int = _INITIAL_CAPACITY,
+            max_size: int = _MAX_READINGS_PER_DEVICE
+    ):
+        """Allocate empty columns with the given row capacity"""
+        self.start = 0
+        self.size = 0
+        self.max_size = max_size
+        self.reading_ids: List[str] = []
+        self.weights = np.empty(capacity, dtype=np.int16)
+        self.heart_rates = np.empty(capacity, dtype=np.int16)
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        self.critical = np.empty(capacity, dtype=np.bool_)
+        self.critical_count = 0
+
+    @staticmethod
+    def _encode(vital_reading: VitalReading) -> Tuple[int, int, bool]:
+        """
+        Column values (weight, heart rate, critical flag) of a reading
+
+        Raises for values the int16 columns cannot hold (non-finite or
+        out-of-range vitals), so callers encode before touching any row
+        and a failed write leaves the buffer unchanged.
+        """
+        weight = round(vital_reading.weight_kg * _WEIGHT_SCALE)
+        heart_rate = vital_reading.heart_rate_bpm
+        if not (_INT16_MIN <= weight <= _INT16_MAX
+                and _INT16_MIN <= heart_rate <= _INT16_MAX):
+            raise OverflowError(
+                f"Reading {vital_reading.reading_id} does not fit the vital columns"
+            )
+        return weight, heart_rate, vital_reading.is_critical()
+
+    def insert(self, vital_reading: VitalReading) -> Optional[str]:
+        """
+        Insert a reading in timestamp order
+
+        Returns:
+            Id of the oldest reading if it was evicted to stay within
+            max_size, None otherwise
+        """
+        return self._insert_row(vital_reading, *self._encode(vital_reading))
+
+    def _insert_row(
+            self,
+            vital_reading: VitalReading,
+            weight: int,
+            heart_rate: int,
+            is_critical: bool
+    ) -> Optional[str]:
+        """Insert an already encoded reading (see insert())"""
+        if self.start + self.size == self.weights.shape[0]:
+            self._make_room()
+
+        start, size = self.start, self.size
+        end = start + size
+        time_ns = vital_reading.time_ns
+
+        # Sensor data usually arrives in time order: append without searching
+        if size == 0 or time_ns >= self.timestamps[end - 1]:
+            row = end
+        else:
+            row = start + int(np.searchsorted(
+                self.timestamps[start:end], time_ns, side="right"
+            ))
+
+        # Shift later rows up by one to open the slot
+        if row < end:
+            for column in (
+                    self.weights, self.heart_rates, self.timestamps, self.critical
+            ):
+                column[row + 1:end + 1] = column[row:end]
+
+        self.reading_ids.insert(row, vital_reading.reading_id)
+        self.weights[row] = weight
+        self.heart_rates[row] = heart_rate
+        self.timestamps[row] = time_ns
+        self.critical[row] = is_critical
+        self.critical_count += is_critical
+        self.size = size + 1
+
+        if self.size > self.max_size:
+            return self._evict_oldest()
+        return None
+
+    def extend(self, vital_readings: List[VitalReading]) -> List[str]:
+        """
+        Insert several readings of this device
+
+        A time-ordered batch that starts after the newest row and fits
+        within max_size is written with one slice assignment per column;
+        anything else falls back to row-by-row insert().
+
+        Every reading is encoded before the first row is written, so a
+        batch containing an unstorable reading is rejected as a whole.
+
+        Returns:
+            Ids of the readings evicted to stay within max_size
+        """
+        encoded = [self._encode(vital_reading) for vital_reading in vital_readings]
+        count = len(vital_readings)
+        time_ns = [vital_reading.time_ns for vital_reading in vital_readings]
+        end = self.start + self.size
+
+        appendable = (
+            self.size + count <= self.max_size
+            and (self.size == 0 or time_ns[0] >= self.timestamps[end - 1])
+            and all(a <= b for a, b in zip(time_ns, time_ns[1:]))
+        )
+        if not appendable:
+            evicted = [
+                self._insert_row(vital_reading, *values)
+                for vital_reading, values in zip(vital_readings, encoded)
+            ]
+            return [reading_id for reading_id in evicted if reading_id is not None]
+
+        if end + count > self.weights.shape[0]:
+            self._make_room(count)
+            end = self.size
+
+        rows = slice(end, end + count)
+        weights, heart_rates, critical = zip(*encoded)
+        self.reading_ids.extend(
+            vital_reading.reading_id for vital_reading in vital_readings
+        )
+        self.weights[rows] = weights
+        self.heart_rates[rows] = heart_rates
+        self.timestamps[rows] = time_ns
+        self.critical[rows] = critical
+        self.critical_count += sum(critical)
+        self.size += count
+        return []
+
+    def _evict_oldest(self) -> str:
+        """Drop the oldest live row and return its reading id"""
+        row = self.start
+        self.critical_count -= bool(self.critical[row])
+        self.start = row + 1
+        self.size -= 1
+        return self.reading_ids[row]
+
+    def _make_room(self, needed: int = 1):
+        """Move live rows to the front, growing capacity when mostly full"""
+        start, size = self.start, self.size
+        capacity = self.weights.shape[0]
+        if (size + needed) * 2 > capacity:
+            capacity = max(capacity * 2, _INITIAL_CAPACITY, size + needed)
+
+        for name in ("weights", "heart_rates", "timestamps", "critical"):
+            column = getattr(self, name)
+            if capacity != column.shape[0]:
+                moved = np.empty(capacity, dtype=column.dtype)
+                moved[:size] = column[start:start + size]
+                setattr(self, name, moved)
+            else:
+                column[:size] = column[start:start + size]
+
+        del self.reading_ids[:start]
+        self.start = 0
+
+    def recent_rows(self, limit: int) -> np.ndarray:
+        """Row indices ordered by timestamp (most recent first), up to limit"""
+        start = self.start
+        end = start + self.size
+        stop = max(end - max(limit, 0), start)
+        return np.arange(end - 1, stop - 1, -1)
+
+    def recent_slice(self, limit: int) -> slice:
+        """Same rows as recent_rows() as a reversed slice, for C-level copies"""
+        start = self.start
+        end = start + self.size
+        stop = max(end - max(limit, 0), start)
+        return slice(end - 1, stop - 1 if stop > 0 else None, -1)
+
+    def critical_rows(self, window: Optional[int] = None) -> np.ndarray:
+        """Critical row indices (most recent first) within the last `window` rows"""
+        start = self.start
+        end = start + self.size
+        if window is not None:
+            start = max(end - window, start)
+        return np.flatnonzero(self.critical[start:end])[::-1] + start
+
+    def row_of(self, reading_id: str, time_ns: int) -> int:
+        """
+        Row index of a live reading
+
+        Binary-searches the sorted timestamp column, then checks the ids
+        of the (usually single) row sharing that timestamp, so the lookup
+        is O(log N) and stays correct after inserts shift rows.
+        """
+        start = self.start
+        end = start + self.size
+        row = start + int(np.searchsorted(
+            self.timestamps[start:end], time_ns, side="left"
+        ))
+        while row < end and self.timestamps[row] == time_ns:
+            if self.reading_ids[row] == reading_id:
+                return row
+            row += 1
+        raise ValueError(f"Reading {reading_id} is not stored in this buffer")
+
+    def to_entity(self, device_id: str, row: int) -> VitalReading:
+        """Rehydrate a row as a VitalReading (values were validated on save)"""
+        return VitalReading(
+            device_id=device_id,
+            weight_kg=int(self.weights[row]) / _WEIGHT_SCALE,
+            heart_rate_bpm=int(self.heart_rates[row]),
+            reading_id=self.reading_ids[row],
+            time_ns=int(self.timestamps[row]),
+            validate=False
+        )
+
 
 class InMemoryVitalRepository(IVitalRepository):
     """
     In-Memory implementation of VitalRepository
 
-    This implementation stores data in memory using dictionaries.
-    Suitable for development, testing, and edge scenarios with
-    limited connectivity.
+    This implementation stores data in memory using a Struct-of-Arrays
+    layout: one set of NumPy columns per device, kept sorted by
+    timestamp, instead of one object per reading. Suitable for
+    development, testing, and edge scenarios with limited connectivity.
+
+    Each device keeps only its most recent `max_readings_per_device`
+    readings, so memory stays bounded on long-running edge nodes.
+
+    Device ids are interned to small integer handles on first save;
+    per-device state lives in lists indexed by handle.
 
     Storage structure:
-    - _readings: Dict[reading_id, VitalReading]
-    - _device_readings: Dict[device_id, List[reading_id]]
+    - _device_handles: Dict[device_id, handle]
+    - _device_ids: List[device_id] (by handle)
+    - _buffers: List[_DeviceBuffer] (by handle)
+    - _latest: List[VitalReading] (most recent reading, by handle)
+    - _device_counts: List[int] (readings received, by handle)
+    - _reading_devices: Dict[reading_id, (handle, time_ns)]
+
+    Reading counts are maintained on save and include readings that
+    have since been evicted from the per-device history.
+
+    Nothing here does I/O, so each async method is a thin wrapper over a
+    synchronous `_<method>_sync` implementation that callers holding the
+    concrete repository can use directly. Sync bodies run without
+    yielding to the event loop, so writes are atomic and need no lock.
     """
 
-    def __init__(self):
-        """Initialize in-memory storage"""
-        self._readings: Dict[str, VitalReading] = {}
-        self._device_readings: Dict[str, List[str]] = {}
-        print("📦 InMemoryVitalRepository initialized")
+    def __init__(
+            self,
+            max_readings_per_device: int = _MAX_READINGS_PER_DEVICE,
+            expected_readings_per_device: int = _INITIAL_CAPACITY
+    ):
+        """
+        Initialize in-memory storage
+
+        Args:
+            max_readings_per_device: History kept per device before the
+                oldest readings are evicted
+            expected_readings_per_device: Rows preallocated for each new
+                device, so deployments that know their scale skip the
+                intermediate column doublings
+        """
+        self._max_readings_per_device = max_readings_per_device
+        self._initial_capacity = min(
+            expected_readings_per_device, max_readings_per_device + 1
+        )
+        self._device_handles: Dict[str, int] = {}
+        self._device_ids: List[str] = []
+        self._buffers: List[_DeviceBuffer] = []
+        self._latest: List[Optional[VitalReading]] = []
+        self._device_counts: List[int] = []
+        self._total_readings = 0
+        self._reading_devices: Dict[str, Tuple[int, int]] = {}
+        self._stats_cache: Optional[Tuple[int, dict]] = None
+        logger.info("InMemoryVitalRepository initialized")
+
+    def _handle_of(self, device_id: str) -> int:
+        """
+        Handle of a device, registering it on first sight
+
+        setdefault() resolves known and new devices with a single hash
+        probe; a new device receives the next handle and its state is
+        appended to the per-handle lists.
+        """
+        handle = self._device_handles.setdefault(device_id, len(self._device_ids))
+        if handle == len(self._device_ids):
+            self._device_ids.append(device_id)
+            self._buffers.append(_DeviceBuffer(
+                capacity=self._initial_capacity,
+                max_size=self._max_readings_per_device
+            ))
+            self._latest.append(None)
+            self._device_counts.append(0)
+        return handle
+
+    def _discard_if_new(self, handle: int):
+        """Undo _handle_of() for a device whose first write failed"""
+        if handle == len(self._device_ids) - 1 and not self._device_counts[handle]:
+            del self._device_handles[self._device_ids[handle]]
+            self._device_counts.pop()
+            self._device_ids.pop()
+            self._buffers.pop()
+            self._latest.pop()
+
+    def _buffer_of(self, device_id: str) -> Optional[_DeviceBuffer]:
+        """Buffer of a known device, None for unknown devices"""
+        handle = self._device_handles.get(device_id)
+        return self._buffers[handle] if handle is not None else None
 
     async def save(self, vital_reading: VitalReading) -> VitalReading:
         """
@@ -41,20 +379,113 @@ class InMemoryVitalRepository(IVitalRepository):
         Returns:
             The saved VitalReading entity
         """
-        # Store reading
-        self._readings[vital_reading.reading_id] = vital_reading
+        return self._save_sync(vital_reading)
+
+    def _save_sync(self, vital_reading: VitalReading) -> VitalReading:
+        """Synchronous implementation of save"""
+        # Reading ids identify one stored row: a duplicate would leave two
+        # rows behind one index entry, so it is rejected before any write
+        if vital_reading.reading_id in self._reading_devices:
+            raise ValueError(f"Reading {vital_reading.reading_id} is already stored")
+
+        handle = self._handle_of(vital_reading.device_id)
+
+        # Store reading as a new row and index it by id
+        try:
+            evicted_id = self._buffers[handle].insert(vital_reading)
+        except Exception:
+            self._discard_if_new(handle)
+            raise
+        self._reading_devices[vital_reading.reading_id] = (
+            handle, vital_reading.time_ns
+        )
+        if evicted_id is not None:
+            self._reading_devices.pop(evicted_id, None)
+        self._device_counts[handle] += 1
+        self._total_readings += 1
+
+        # Keep the latest-reading pointer current (ties go to the newest save)
+        latest = self._latest[handle]
+        if latest is None or vital_reading.time_ns >= latest.time_ns:
+            self._latest[handle] = vital_reading
+
+        # Lazy %-formatting: no string is built unless DEBUG is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Saved reading %s for device %s",
+                vital_reading.reading_id,
+                vital_reading.device_id
+            )
 
-        # Index by device
-        if vital_reading.device_id not in self._device_readings:
-            self._device_readings[vital_reading.device_id] = []
+        return vital_reading
 
-        self._device_readings[vital_reading.device_id].append(
-            vital_reading.reading_id
-        )
+    async def save_many(
+            self,
+            vital_readings: Sequence[VitalReading]
+    ) -> List[VitalReading]:
+        """
+        Save several vital readings to memory in one call
 
-        print(f"✅ Saved reading {vital_reading.reading_id} for device {vital_reading.device_id}")
+        Args:
+            vital_readings: The VitalReading entities to save
 
-        return vital_reading
+        Returns:
+            The saved VitalReading entities
+        """
+        return self._save_many_sync(vital_readings)
+
+    def _save_many_sync(
+            self,
+            vital_readings: Sequence[VitalReading]
+    ) -> List[VitalReading]:
+        """Synchronous implementation of save_many"""
+        # Group by device (keeping arrival order) so each device's handle,
+        # counters and latest pointer are touched once per batch
+        by_device: Dict[str, List[VitalReading]] = {}
+        for vital_reading in vital_readings:
+            by_device.setdefault(vital_reading.device_id, []).append(vital_reading)
+
+        for device_id, device_readings in by_device.items():
+            # extend() rejects the group before writing any row, and the
+            # counters below advance per group, so a failing device leaves
+            # the groups saved before it committed and consistent
+            reading_ids = [vital_reading.reading_id for vital_reading in device_readings]
+            if (len(set(reading_ids)) != len(reading_ids)
+                    or not self._reading_devices.keys().isdisjoint(reading_ids)):
+                raise ValueError(f"Duplicate reading ids for device {device_id}")
+
+            handle = self._handle_of(device_id)
+            try:
+                evicted_ids = self._buffers[handle].extend(device_readings)
+            except Exception:
+                self._discard_if_new(handle)
+                raise
+
+            # Index the new ids first: an evicted id may belong to this batch
+            self._reading_devices.update(
+                (vital_reading.reading_id, (handle, vital_reading.time_ns))
+                for vital_reading in device_readings
+            )
+            for evicted_id in evicted_ids:
+                self._reading_devices.pop(evicted_id, None)
+            self._device_counts[handle] += len(device_readings)
+            self._total_readings += len(device_readings)
+
+            # Latest pointer: newest timestamp, ties go to the last saved
+            latest = self._latest[handle]
+            for vital_reading in device_readings:
+                if latest is None or vital_reading.time_ns >= latest.time_ns:
+                    latest = vital_reading
+            self._latest[handle] = latest
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Saved %d readings for %d devices",
+                len(vital_readings),
+                len(by_device)
+            )
+
+        return list(vital_readings)
 
     async def find_by_id(self, reading_id: str) -> Optional[VitalReading]:
         """
@@ -66,7 +497,19 @@ class InMemoryVitalRepository(IVitalRepository):
         Returns:
             VitalReading if found, None otherwise
         """
-        return self._readings.get(reading_id)
+        return self._find_by_id_sync(reading_id)
+
+    def _find_by_id_sync(self, reading_id: str) -> Optional[VitalReading]:
+        """Synchronous implementation of find_by_id"""
+        location = self._reading_devices.get(reading_id)
+        if location is None:
+            return None
+
+        handle, time_ns = location
+        buffer = self._buffers[handle]
+        return buffer.to_entity(
+            self._device_ids[handle], buffer.row_of(reading_id, time_ns)
+        )
 
     async def find_by_device(
             self,
@@ -83,24 +526,62 @@ class InMemoryVitalRepository(IVitalRepository):
         Returns:
             List of VitalReading entities, ordered by timestamp (most recent first)
         """
-        if device_id not in self._device_readings:
-            return []
+        return self._find_by_device_sync(device_id, limit)
 
-        # Get reading IDs for device
-        reading_ids = self._device_readings[device_id]
+    def _find_by_device_sync(
+            self,
+            device_id: str,
+            limit: int = 50
+    ) -> List[VitalReading]:
+        """Synchronous implementation of find_by_device"""
+        buffer = self._buffer_of(device_id)
+        if buffer is None:
+            return []
 
-        # Get actual readings
-        readings = [
-            self._readings[rid]
-            for rid in reading_ids
-            if rid in self._readings
+        return [
+            buffer.to_entity(device_id, row)
+            for row in buffer.recent_rows(limit).tolist()
         ]
 
-        # Sort by timestamp (most recent first)
-        readings.sort(key=lambda r: r.timestamp, reverse=True)
+    async def find_by_device_arrays(
+            self,
+            device_id: str,
+            limit: int = 50
+    ) -> VitalReadingColumns:
+        """
+        Find vital readings for a device as parallel columns
 
-        # Apply limit
-        return readings[:limit]
+        Args:
+            device_id: Identifier of the IoT device
+            limit: Maximum number of readings to return
+
+        Returns:
+            VitalReadingColumns ordered by timestamp (most recent first)
+        """
+        return self._find_by_device_arrays_sync(device_id, limit)
+
+    def _find_by_device_arrays_sync(
+            self,
+            device_id: str,
+            limit: int = 50
+    ) -> VitalReadingColumns:
+        """Synchronous implementation of find_by_device_arrays"""
+        buffer = self._buffer_of(device_id)
+        if buffer is None:
+            buffer = _DeviceBuffer(capacity=0)
+
+        # Recent rows are a contiguous tail: slice every column in C
+        # instead of indexing row by row (columns are copied, since later
+        # inserts shift rows in place)
+        rows = buffer.recent_slice(limit)
+
+        return VitalReadingColumns(
+            device_id=device_id,
+            reading_ids=buffer.reading_ids[rows],
+            weights=buffer.weights[rows] / _WEIGHT_SCALE,
+            heart_rates=buffer.heart_rates[rows].copy(),
+            timestamps=buffer.timestamps[rows].copy()
+        )
 
     async def find_latest_by_device(
             self,
@@ -115,8 +596,15 @@ class InMemoryVitalRepository(IVitalRepository):
         Returns:
             Most recent VitalReading if found, None otherwise
         """
-        readings = await self.find_by_device(device_id, limit=1)
-        return readings[0] if readings else None
+        return self._find_latest_by_device_sync(device_id)
+
+    def _find_latest_by_device_sync(
+            self,
+            device_id: str
+    ) -> Optional[VitalReading]:
+        """Synchronous implementation of find_latest_by_device"""
+        handle = self._device_handles.get(device_id)
+        return self._latest[handle] if handle is not None else None
 
     async def count_by_device(self, device_id: str) -> int:
         """
@@ -128,33 +616,72 @@ class InMemoryVitalRepository(IVitalRepository):
         Returns:
             Total number of readings
         """
-        if device_id not in self._device_readings:
-            return 0
-        return len(self._device_readings[device_id])
+        return self._count_by_device_sync(device_id)
+
+    def _count_by_device_sync(self, device_id: str) -> int:
+        """Synchronous implementation of count_by_device"""
+        handle = self._device_handles.get(device_id)
+        return self._device_counts[handle] if handle is not None else 0
 
     async def find_critical_readings(
             self,
-            device_id: Optional[str] = None
+            device_id: Optional[str] = None,
+            limit: Optional[int] = None
     ) -> List[VitalReading]:
         """
         Find all critical vital readings
 
         Args:
             device_id: Optional device filter
+            limit: Optional maximum number of readings to return
 
         Returns:
-            List of critical VitalReading entities
+            List of critical VitalReading entities, ordered by timestamp
+            (most recent first)
         """
+        return self._find_critical_readings_sync(device_id, limit)
+
+    def _find_critical_readings_sync(
+            self,
+            device_id: Optional[str] = None,
+            limit: Optional[int] = None
+    ) -> List[VitalReading]:
+        """Synchronous implementation of find_critical_readings"""
         if device_id:
-            readings = await self.find_by_device(device_id, limit=1000)
+            buffer = self._buffer_of(device_id)
+            candidates = [(device_id, buffer)] if buffer else []
+            window = 1000
         else:
-            readings = list(self._readings.values())
+            candidates = zip(self._device_ids, self._buffers)
+            window = None
+
+        # Read the stored critical flags; devices without any are skipped.
+        # Rows come most recent first, so with a limit no device can
+        # contribute more than its first `limit` rows to the result.
+        sources = [
+            (device, buffer, buffer.critical_rows(window)[:limit])
+            for device, buffer in candidates
+            if buffer.critical_count
+        ]
+        if not sources:
+            return []
 
-        # Filter critical readings
-        critical = [r for r in readings if r.is_critical()]
+        # Order every critical row by timestamp (most recent first) with a
+        # single vectorized sort over the flattened columns
+        timestamps = np.concatenate(
+            [buffer.timestamps[rows] for _, buffer, rows in sources]
+        )
+        source_index = np.repeat(
+            np.arange(len(sources)), [rows.size for _, _, rows in sources]
+        )
+        rows = np.concatenate([rows for _, _, rows in sources])
+        order = np.argsort(-timestamps, kind="stable")[:limit]
 
-        # Sort by timestamp (most recent first)
-        critical.sort(key=lambda r: r.timestamp, reverse=True)
+        # Rehydrate entities only for the rows being returned
+        critical = []
+        for source, row in zip(source_index[order].tolist(), rows[order].tolist()):
+            device, buffer, _ = sources[source]
+            critical.append(buffer.to_entity(device, row))
 
         return critical
 
@@ -163,13 +690,18 @@ class InMemoryVitalRepository(IVitalRepository):
         Get repository statistics (useful for monitoring)
 
         Returns:
-            Dictionary with storage statistics
-        """
-        return {
-            "total_readings": len(self._readings),
-            "total_devices": len(self._device_readings),
-            "devices": {
-                device_id: len(reading_ids)
-                for device_id, reading_ids in self._device_readings.items()
-            }
-        }
\ No newline at end of file
+            Dictionary with storage statistics. The snapshot is shared
+            between callers until the next save and must not be modified.
+        """
+        # Every save bumps _total_readings, so it doubles as the version
+        # of the snapshot; polls between saves reuse the cached dict. The
+        # per-device dict is only built when the version has changed, and
+        # a snapshot never reflects later saves.
+        version = self._total_readings
+        if self._stats_cache is None or self._stats_cache[0] != version:
+            self._stats_cache = (version, {
+                "total_readings": version,
+                "total_devices": len(self._device_ids),
+                "devices": dict(zip(self._device_ids, self._device_counts))
+            })
+        return self._stats_cache[1]